@@ -0,0 +1,103 @@
+"""HttpCache against a local http.server: fresh hits, revalidation, TTL expiry and offline fallback."""
+import hashlib
+import http.server
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import VPXmerge  # noqa: E402
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append(dict(self.headers))
+        if server.status != 200:
+            self.send_response(server.status)
+            self.end_headers()
+            return
+        etag = '"%s"' % hashlib.sha1(server.body).hexdigest()
+        if self.headers.get("If-None-Match") == etag or (
+                server.etag is None and self.headers.get("If-Modified-Since") == server.modified):
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        if server.etag is not None:
+            self.send_header("ETag", etag)
+        self.send_header("Last-Modified", server.modified)
+        self.send_header("Content-Length", str(len(server.body)))
+        self.end_headers()
+        self.wfile.write(server.body)
+
+
+class HttpCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.server.requests = []
+        self.server.status = 200
+        self.server.body = b'{"tables": 1}'
+        self.server.etag = True
+        self.server.modified = "Wed, 01 Jan 2025 00:00:00 GMT"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = "http://127.0.0.1:%d/vpsdb.json" % self.server.server_port
+        self.root = tempfile.mkdtemp()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def cache(self, max_age=3600):
+        # A new instance each time, so every step goes through the on-disk index
+        return VPXmerge.HttpCache(root=self.root, max_age=max_age)
+
+    def test_download_then_fresh_hit_without_request(self):
+        self.assertEqual(self.cache().get(self.url), (self.server.body, "downloaded"))
+        self.assertEqual(self.cache().get(self.url), (self.server.body, "cached"))
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_expired_entry_revalidates_with_etag(self):
+        self.cache().get(self.url)
+        self.assertEqual(self.cache(max_age=0).get(self.url), (self.server.body, "revalidated"))
+        self.assertEqual(self.server.requests[-1]["If-None-Match"],
+                         '"%s"' % hashlib.sha1(self.server.body).hexdigest())
+        # The 304 renewed the entry, so it is fresh again for a normal TTL
+        self.assertEqual(self.cache().get(self.url)[1], "cached")
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_expired_entry_revalidates_with_last_modified(self):
+        self.server.etag = None
+        self.cache().get(self.url)
+        self.assertEqual(self.cache(max_age=0).get(self.url)[1], "revalidated")
+        self.assertEqual(self.server.requests[-1]["If-Modified-Since"], self.server.modified)
+
+    def test_expired_entry_replaced_when_changed(self):
+        self.cache().get(self.url)
+        self.server.body = b'{"tables": 2}'
+        self.assertEqual(self.cache(max_age=0).get(self.url), (b'{"tables": 2}', "downloaded"))
+        self.assertEqual(self.cache().get(self.url), (b'{"tables": 2}', "cached"))
+
+    def test_failure_serves_stale_copy(self):
+        self.cache().get(self.url)
+        self.server.status = 500
+        self.assertEqual(self.cache(max_age=0).get(self.url), (self.server.body, "stale"))
+        self.server.shutdown()
+        self.server.server_close()
+        self.assertEqual(self.cache(max_age=0).get(self.url), (self.server.body, "stale"))
+
+    def test_failure_without_copy_raises(self):
+        self.server.status = 500
+        with self.assertRaises(Exception):
+            self.cache().get(self.url)
+
+
+if __name__ == "__main__":
+    unittest.main()